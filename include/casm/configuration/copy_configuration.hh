@@ -66,6 +66,13 @@ std::vector<Configuration> make_distinct_super_configurations(
     Configuration const &motif,
     std::shared_ptr<Supercell const> const &supercell);
 
+/// \brief Make all equivalent configurations with respect to the prim factor
+/// group that fill a supercell, by applying every tiling prim factor group
+/// operation
+std::set<Configuration> make_all_super_configurations_check(
+    Configuration const &motif,
+    std::shared_ptr<Supercell const> const &supercell);
+
 /// \brief Make all equivalent configurations with respect to the prim factor
 /// group that fill a supercell
 std::vector<ConfigurationWithProperties> make_all_super_configurations(
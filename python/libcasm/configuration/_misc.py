@@ -1,4 +1,3 @@
-import copy
 import functools
 import math
 from typing import Optional
@@ -10,6 +9,8 @@ import libcasm.casmglobal
 
 @functools.total_ordering
 class ApproximateFloatArray:
+    __slots__ = ("arr", "abs_tol")
+
     def __init__(
         self,
         arr: np.ndarray,
@@ -72,7 +73,7 @@ def make_canonical_order_parameters(
     for M in dof_space_rep:
         _test = ApproximateFloatArray(M @ eta, abs_tol=abs_tol)
         if _test > _most_canonical:
-            _most_canonical = copy.deepcopy(_test)
+            _most_canonical = _test
     return _most_canonical.arr
 
 
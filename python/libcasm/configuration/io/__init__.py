@@ -71,6 +71,7 @@ def supercell_list_from_data(
 
 def configuration_list_to_data(
     configuration_list: List[_config.Configuration],
+    write_prim_basis: bool = False,
 ) -> List[Dict]:
     """Represent a List[:class:`~libcasm.configuration.Configuration`] as a List[Dict]
 
@@ -78,20 +79,26 @@ def configuration_list_to_data(
 
     .. code-block:: Python
 
-        data_list = [x.to_dict() for x in configuration_list]
+        data_list = [
+            x.to_dict(write_prim_basis=write_prim_basis)
+            for x in configuration_list
+        ]
 
 
     Parameters
     ----------
     configuration_list: List[:class:`~libcasm.configuration.Configuration`]
         A list of :class:`~libcasm.configuration.Configuration`.
+    write_prim_basis: bool = False
+        If True, write DoF values using the prim basis. Default (False) is to
+        write DoF values in the standard basis.
 
     Returns
     -------
     data_list: List[Dict]
         The representation of the configuration list as List[Dict].
     """
-    return [x.to_dict() for x in configuration_list]
+    return [x.to_dict(write_prim_basis=write_prim_basis) for x in configuration_list]
 
 
 def configuration_list_from_data(
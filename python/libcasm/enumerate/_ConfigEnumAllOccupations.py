@@ -14,13 +14,12 @@ from ._ScelEnum import ScelEnum
 
 
 def _make_sublat_sites(supercell: casmconfig.Supercell, sublats: set[int]):
-    converter = supercell.site_index_converter
-    sites = set()
-    for i in range(supercell.n_sites):
-        integral_site_coordinate = converter.integral_site_coordinate(i)
-        if integral_site_coordinate.sublattice() in sublats:
-            sites.add(i)
-    return sites
+    integral_site_coordinate = supercell.site_index_converter.integral_site_coordinate
+    return {
+        i
+        for i in range(supercell.n_sites)
+        if integral_site_coordinate(i).sublattice() in sublats
+    }
 
 
 class ConfigEnumAllOccupations:
@@ -171,18 +170,19 @@ class ConfigEnumAllOccupations:
                 site_indices=sites,
             )
         while config_enum.is_valid():
+            config = config_enum.value()
             if skip_non_primitive and not casmconfig.is_primitive_configuration(
-                configuration=config_enum.value()
+                configuration=config
             ):
                 config_enum.advance()
                 continue
             if skip_non_canonical and not casmconfig.is_canonical_configuration(
-                configuration=config_enum.value(),
+                configuration=config,
                 subgroup=background_fg,
             ):
                 config_enum.advance()
                 continue
-            yield config_enum.value()
+            yield config
             config_enum.advance()
 
     def by_supercell(
@@ -231,13 +231,12 @@ class ConfigEnumAllOccupations:
                 motif=motif, supercell=supercell
             )
             for background in super_configurations:
-                for config in self._by_site(
+                yield from self._by_site(
                     background=background,
                     sites=sites,
                     skip_non_primitive=skip_non_primitive,
                     skip_non_canonical=skip_non_canonical,
-                ):
-                    yield config
+                )
 
     def by_supercell_list(
         self,
@@ -252,6 +251,7 @@ class ConfigEnumAllOccupations:
         ----------
         supercells: list[casmconfig.Supercell]
             An explicit list of supercells in which to perform enumeration.
+            Duplicate supercells are skipped.
         motif: Optional[casmconfig.Configuration] = None
             The background configuration on which enumeration takes place. The motif is
             filled into each supercell using
@@ -274,19 +274,25 @@ class ConfigEnumAllOccupations:
         """
         self._begin()
         motif = self._set_motif(motif)
+        # supercells share the prim, so they are equal if their transformation
+        # matrices are equal
+        unique_T = set()
         for supercell in supercells:
+            T_key = supercell.transformation_matrix_to_super.tobytes()
+            if T_key in unique_T:
+                continue
+            unique_T.add(T_key)
             sites = set(range(supercell.n_sites))
             super_configurations = casmconfig.make_distinct_super_configurations(
                 motif=motif, supercell=supercell
             )
             for background in super_configurations:
-                for config in self._by_site(
+                yield from self._by_site(
                     background=background,
                     sites=sites,
                     skip_non_primitive=skip_non_primitive,
                     skip_non_canonical=skip_non_canonical,
-                ):
-                    yield config
+                )
 
     def by_linear_site_indices(
         self,
@@ -319,13 +325,12 @@ class ConfigEnumAllOccupations:
             A :class:`~casmconfig.Configuration`.
         """
         self._begin()
-        for config in self._by_site(
+        yield from self._by_site(
             background=background,
             sites=sites,
             skip_non_primitive=skip_non_primitive,
             skip_non_canonical=skip_non_canonical,
-        ):
-            yield config
+        )
 
     def by_integral_site_coordinates(
         self,
@@ -360,13 +365,12 @@ class ConfigEnumAllOccupations:
         self._begin()
         converter = background.supercell.site_index_converter
         site_indices = set([converter.linear_site_index(site) for site in sites])
-        for config in self._by_site(
+        yield from self._by_site(
             background=background,
             sites=site_indices,
             skip_non_primitive=skip_non_primitive,
             skip_non_canonical=skip_non_canonical,
-        ):
-            yield config
+        )
 
     def by_sublattice(
         self,
@@ -418,13 +422,12 @@ class ConfigEnumAllOccupations:
                 motif=background, supercell=supercell
             )
             for super_background in super_backgrounds:
-                for config in self._by_site(
+                yield from self._by_site(
                     background=super_background,
                     sites=sublat_sites,
                     skip_non_primitive=skip_non_primitive,
                     skip_non_canonical=skip_non_canonical,
-                ):
-                    yield config
+                )
 
     def by_cluster(
         self,
@@ -492,13 +495,12 @@ class ConfigEnumAllOccupations:
                     orbits=orbits,
                 )
                 for cluster_sites in distinct_cluster_sites:
-                    for config in self._by_site(
+                    yield from self._by_site(
                         background=super_background,
                         sites=cluster_sites,
                         skip_non_primitive=skip_non_primitive,
                         skip_non_canonical=skip_non_canonical,
-                    ):
-                        yield config
+                    )
 
     def by_cluster_list(
         self,
@@ -546,14 +548,16 @@ class ConfigEnumAllOccupations:
         )
 
         orbits = []
-        orbit_prototypes = []
+        orbit_prototypes = set()
         for cluster in clusters:
             orbit = casmclust.make_periodic_orbit(
                 orbit_element=cluster,
                 integral_site_coordinate_symgroup_rep=self.prim.integral_site_coordinate_symgroup_rep,
             )
-            if orbit[0] not in orbit_prototypes:
-                orbit_prototypes.append(orbit[0])
+            # clusters are not hashable, so use their sites as `(b, i, j, k)`
+            prototype = tuple(tuple(site) for site in orbit[0].to_list())
+            if prototype not in orbit_prototypes:
+                orbit_prototypes.add(prototype)
                 orbits.append(orbit)
 
         for supercell in supercell_list:
@@ -566,10 +570,9 @@ class ConfigEnumAllOccupations:
                     orbits=orbits,
                 )
                 for cluster_sites in distinct_cluster_sites:
-                    for config in self._by_site(
+                    yield from self._by_site(
                         background=super_background,
                         sites=cluster_sites,
                         skip_non_primitive=skip_non_primitive,
                         skip_non_canonical=skip_non_canonical,
-                    ):
-                        yield config
+                    )
@@ -1,3 +1,4 @@
+import bisect
 import copy
 from typing import Optional, Union
 
@@ -9,7 +10,7 @@ import libcasm.clexulator as casmclex
 import libcasm.configuration as casmconfig
 import libcasm.counter
 from libcasm.configuration._misc import (
-    equivalent_order_parameters_index,
+    ApproximateFloatArray,
     make_canonical_order_parameters,
 )
 from libcasm.irreps import (
@@ -27,6 +28,28 @@ def _is_corner_point(
     return False
 
 
+def _add_if_distinct(
+    canonical_configs: Union[casmconfig.ConfigurationSet, list],
+    canonical_config: casmconfig.Configuration,
+) -> bool:
+    """Add `canonical_config` to `canonical_configs`, if not already present
+
+    `canonical_configs` is either a ConfigurationSet, for configurations in the
+    canonical supercell, or a sorted list of Configuration, which is searched using
+    bisection. Returns True if `canonical_config` was added, False otherwise.
+    """
+    if isinstance(canonical_configs, casmconfig.ConfigurationSet):
+        if canonical_config in canonical_configs:
+            return False
+        canonical_configs.add(canonical_config)
+        return True
+    i = bisect.bisect_left(canonical_configs, canonical_config)
+    if i != len(canonical_configs) and canonical_configs[i] == canonical_config:
+        return False
+    canonical_configs.insert(i, canonical_config)
+    return True
+
+
 def _subwedge_counter(
     subwedge: SubWedge,
     stop: float,
@@ -114,22 +137,15 @@ def meshgrid_points(
     for indices in counter:
         eta = np.array([x[i] for x, i in zip(xi, indices)])
         if skip_equivalents:
-            if (
-                equivalent_order_parameters_index(
-                    canonical_eta_list=canonical_eta_list,
-                    eta=eta,
-                    dof_space_rep=dof_space_rep,
-                    abs_tol=abs_tol,
-                )
-                is not None
-            ):
+            canonical_eta = ApproximateFloatArray(
+                make_canonical_order_parameters(
+                    eta=eta, dof_space_rep=dof_space_rep, abs_tol=abs_tol
+                ),
+                abs_tol=abs_tol,
+            )
+            if canonical_eta in canonical_eta_list:
                 continue
-            else:
-                canonical_eta_list.append(
-                    make_canonical_order_parameters(
-                        eta=eta, dof_space_rep=dof_space_rep, abs_tol=abs_tol
-                    )
-                )
+            canonical_eta_list.append(canonical_eta)
         yield eta
 
 
@@ -217,22 +233,15 @@ def irreducible_wedge_points(
             eta = dof_space.basis_inv @ subwedge.trans_mat @ eta_subwedge
 
             if skip_equivalents:
-                if (
-                    equivalent_order_parameters_index(
-                        canonical_eta_list=canonical_eta_list,
-                        eta=eta,
-                        dof_space_rep=dof_space_rep,
-                        abs_tol=abs_tol,
-                    )
-                    is not None
-                ):
+                canonical_eta = ApproximateFloatArray(
+                    make_canonical_order_parameters(
+                        eta=eta, dof_space_rep=dof_space_rep, abs_tol=abs_tol
+                    ),
+                    abs_tol=abs_tol,
+                )
+                if canonical_eta in canonical_eta_list:
                     continue
-                else:
-                    canonical_eta_list.append(
-                        make_canonical_order_parameters(
-                            eta=eta, dof_space_rep=dof_space_rep, abs_tol=abs_tol
-                        )
-                    )
+                canonical_eta_list.append(canonical_eta)
             yield (subwedge_index, eta)
 
 
@@ -372,6 +381,7 @@ class ConfigEnumMeshGrid:
             if is_canonical_background_supercell:
                 canonical_configs = casmconfig.ConfigurationSet()
             else:
+                # kept sorted, see _add_if_distinct
                 canonical_configs = []
 
         for eta in meshgrid_points(
@@ -388,13 +398,8 @@ class ConfigEnumMeshGrid:
             )
             if skip_equivalents:
                 canonical_config = casmconfig.make_canonical_configuration(config)
-                if canonical_config in canonical_configs:
+                if not _add_if_distinct(canonical_configs, canonical_config):
                     continue
-                else:
-                    if is_canonical_background_supercell:
-                        canonical_configs.add(canonical_config)
-                    else:
-                        canonical_configs.append(canonical_config)
             self._order_parameters = eta
             yield config
 
@@ -444,14 +449,13 @@ class ConfigEnumMeshGrid:
                 'Invalid dof_space, dof_space.dof_key == "occ" is not supported'
             )
 
-        for config in self._by_grid_coordinates(
+        yield from self._by_grid_coordinates(
             background=background,
             dof_space=dof_space,
             xi=xi,
             skip_equivalents=skip_equivalents,
             abs_tol=abs_tol,
-        ):
-            yield config
+        )
 
     def by_range(
         self,
@@ -543,14 +547,13 @@ class ConfigEnumMeshGrid:
                 "One and only one of 'step' or 'num' is required"
             )
 
-        for config in self._by_grid_coordinates(
+        yield from self._by_grid_coordinates(
             background=background,
             dof_space=dof_space,
             xi=xi,
             skip_equivalents=skip_equivalents,
             abs_tol=abs_tol,
-        ):
-            yield config
+        )
 
     def by_irreducible_wedge(
         self,
@@ -632,6 +635,7 @@ class ConfigEnumMeshGrid:
             if is_canonical_background_supercell:
                 canonical_configs = casmconfig.ConfigurationSet()
             else:
+                # kept sorted, see _add_if_distinct
                 canonical_configs = []
 
         for subwedge_index, eta in irreducible_wedge_points(
@@ -651,13 +655,8 @@ class ConfigEnumMeshGrid:
             )
             if skip_equivalents:
                 canonical_config = casmconfig.make_canonical_configuration(config)
-                if canonical_config in canonical_configs:
+                if not _add_if_distinct(canonical_configs, canonical_config):
                     continue
-                else:
-                    if is_canonical_background_supercell:
-                        canonical_configs.add(canonical_config)
-                    else:
-                        canonical_configs.append(canonical_config)
             self._subwedge_index = subwedge_index
             self._order_parameters = eta
             yield config
@@ -195,10 +195,12 @@ class ScelEnum:
             A :class:`~casmconfig.Supercell`, guaranteed to be in canonical
             form.
         """
-        prim_lattice = self.prim.xtal_prim.lattice()
+        prim = self.prim
+        supercell_set = self.supercell_set
+        prim_lattice = prim.xtal_prim.lattice()
         for superlattice in xtal.enumerate_superlattices(
             unit_lattice=prim_lattice,
-            point_group=self.prim.crystal_point_group.elements,
+            point_group=prim.crystal_point_group.elements,
             max_volume=max,
             min_volume=min,
             dirs=dirs,
@@ -210,13 +212,13 @@ class ScelEnum:
                 superlattice=superlattice,
                 unit_lattice=prim_lattice,
             )
-            if self.supercell_set is None:
+            if supercell_set is None:
                 yield casmconfig.Supercell(
-                    self.prim,
+                    prim,
                     transformation_matrix_to_super=T,
                 )
             else:
-                record = self.supercell_set.add_by_transformation_matrix_to_super(
+                record = supercell_set.add_by_transformation_matrix_to_super(
                     transformation_matrix_to_super=T,
                 )
                 yield record.supercell
@@ -12,6 +12,7 @@ from ._ConfigEnumMeshGrid import (
 )
 from ._enumerate import (
     get_occevent_coordinate,
+    get_occevent_coordinates,
     make_distinct_cluster_sites,
     make_occevent_simple_structures,
     make_phenomenal_occevent,
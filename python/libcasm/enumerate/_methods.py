@@ -1,3 +1,5 @@
+import bisect
+
 import libcasm.clusterography
 import libcasm.configuration
 import libcasm.enumerate._enumerate as _enumerate
@@ -96,23 +98,30 @@ def make_occevent_suborbits(
     )
     orbit = libcasm.occ_events.make_prim_periodic_orbit(occ_event, prim_rep)
 
-    def in_any_suborbit(x, suborbits):
-        for suborbit in suborbits:
-            if x in suborbit:
-                return True
-        return False
-
     suborbits = []
     scel_factor_group = supercell.factor_group
     scel_rep = libcasm.occ_events.make_occevent_symgroup_rep(
         scel_factor_group.elements, prim.xtal_prim
     )
-    for x in orbit:
-        if in_any_suborbit(x, suborbits):
+
+    # orbit is sorted, so the index of an element can be found with bisect;
+    # in_suborbit[i] is True if orbit[i] is already in one of the suborbits
+    in_suborbit = [False] * len(orbit)
+    for i, x in enumerate(orbit):
+        if in_suborbit[i]:
             continue
+        # new_suborbit contains x, which is in no existing suborbit, so it is
+        # always distinct from the existing suborbits
         new_suborbit = libcasm.occ_events.make_prim_periodic_orbit(x, scel_rep)
-        if new_suborbit not in suborbits:
-            suborbits.append(new_suborbit)
+        for y in new_suborbit:
+            j = bisect.bisect_left(orbit, y)
+            if j == len(orbit) or orbit[j] != y:
+                raise Exception(
+                    "Error in make_occevent_suborbits: "
+                    "suborbit element not found in prim orbit"
+                )
+            in_suborbit[j] = True
+        suborbits.append(new_suborbit)
     return suborbits
 
 
@@ -93,11 +93,32 @@ std::vector<xtal::SimpleStructure> make_occevent_simple_structures(
   return results;
 }
 
+/// \brief Return the origin unit cell of each sorted phenomenal cluster
+///
+/// \param phenomenal_occevent The phenomenal OccEvent of the equivalent
+///     local basis sets
+///
+/// \return Returns `phenomenal_unitcells`, where `phenomenal_unitcells[i]` is
+///     the unit cell of the first site of the sorted cluster of
+///     `phenomenal_occevent[i]`.
+std::vector<xtal::UnitCell> make_phenomenal_unitcells(
+    std::vector<occ_events::OccEvent> const &phenomenal_occevent) {
+  std::vector<xtal::UnitCell> phenomenal_unitcells;
+  for (auto const &phenom : phenomenal_occevent) {
+    auto phenom_cluster = make_cluster(phenom);
+    phenom_cluster.sort();
+    phenomenal_unitcells.push_back(phenom_cluster[0].unitcell());
+  }
+  return phenomenal_unitcells;
+}
+
 /// \brief Return (unitcell_index,equivalent_index) of a particular OccEvent
 ///
 /// \param occ_event Input OccEvent, to find the coordinates of
 /// \param phenomenal_occevent The phenomenal OccEvent of the equivalent
 ///     local basis sets
+/// \param phenomenal_unitcells The result of
+///     `make_phenomenal_unitcells(phenomenal_occevent)`
 /// \param supercell The supercell in which the OccEvent is located
 ///
 /// \return Returns the coordinate (unitcell_index, equivalent_index) of
@@ -106,14 +127,13 @@ std::vector<xtal::SimpleStructure> make_occevent_simple_structures(
 std::tuple<Index, Index> get_occevent_coordinate(
     occ_events::OccEvent occ_event,
     std::vector<occ_events::OccEvent> const &phenomenal_occevent,
+    std::vector<xtal::UnitCell> const &phenomenal_unitcells,
     config::Supercell const &supercell) {
   standardize(occ_event);
   clust::IntegralCluster cluster = make_cluster(occ_event);
   cluster.sort();
   for (Index i = 0; i < phenomenal_occevent.size(); ++i) {
-    auto phenom_cluster = make_cluster(phenomenal_occevent[i]);
-    phenom_cluster.sort();
-    xtal::UnitCell trans = phenom_cluster[0].unitcell() - cluster[0].unitcell();
+    xtal::UnitCell trans = phenomenal_unitcells[i] - cluster[0].unitcell();
     occ_events::OccEvent translated_occ_event = occ_event + trans;
     if (translated_occ_event == phenomenal_occevent[i]) {
       Index unitcell_index = supercell.unitcell_index_converter(trans);
@@ -126,6 +146,57 @@ std::tuple<Index, Index> get_occevent_coordinate(
       "could be found");
 }
 
+/// \brief Return (unitcell_index,equivalent_index) of a particular OccEvent
+///
+/// \param occ_event Input OccEvent, to find the coordinates of
+/// \param phenomenal_occevent The phenomenal OccEvent of the equivalent
+///     local basis sets
+/// \param supercell The supercell in which the OccEvent is located
+///
+/// \return Returns the coordinate (unitcell_index, equivalent_index) of
+///     the input OccEvent. Throws if no match can be found, indicating the
+///     input OccEvent is not in the same orbit.
+std::tuple<Index, Index> get_occevent_coordinate(
+    occ_events::OccEvent occ_event,
+    std::vector<occ_events::OccEvent> const &phenomenal_occevent,
+    config::Supercell const &supercell) {
+  return get_occevent_coordinate(occ_event, phenomenal_occevent,
+                                 make_phenomenal_unitcells(phenomenal_occevent),
+                                 supercell);
+}
+
+/// \brief Return (unitcell_index,equivalent_index) of many OccEvent
+///
+/// \param events_in Input OccEvent, to find the coordinates of
+/// \param phenomenal_occevent The phenomenal OccEvent of the equivalent
+///     local basis sets
+/// \param supercell The supercell in which the OccEvent are located
+///
+/// \return Returns the coordinates (unitcell_index, equivalent_index) of
+///     each input OccEvent, in order. Throws if no match can be found for
+///     any OccEvent, indicating it is not in the same orbit.
+///
+/// Notes:
+/// - Equivalent to calling `get_occevent_coordinate` for each OccEvent, but
+///   the phenomenal clusters are only constructed once.
+/// - The matching logic is duplicated by `get_occevent_coordinate` in
+///   python/src/occ_events.cpp (`libcasm.occ_events.get_occevent_coordinate`).
+///   Keep the two in sync.
+std::vector<std::tuple<Index, Index>> get_occevent_coordinates(
+    std::vector<occ_events::OccEvent> const &events_in,
+    std::vector<occ_events::OccEvent> const &phenomenal_occevent,
+    config::Supercell const &supercell) {
+  std::vector<xtal::UnitCell> phenomenal_unitcells =
+      make_phenomenal_unitcells(phenomenal_occevent);
+  std::vector<std::tuple<Index, Index>> coordinates;
+  coordinates.reserve(events_in.size());
+  for (auto const &occ_event : events_in) {
+    coordinates.push_back(get_occevent_coordinate(
+        occ_event, phenomenal_occevent, phenomenal_unitcells, supercell));
+  }
+  return coordinates;
+}
+
 std::vector<occ_events::OccEvent> make_phenomenal_occevent(
     occ_events::OccEvent prototype,
     std::vector<clust::IntegralCluster> const &phenomenal_clusters,
@@ -366,7 +437,10 @@ PYBIND11_MODULE(_enumerate, m) {
         py::arg("equivalent_generating_op_indices"), py::arg("prim"));
 
   //
-  m.def("get_occevent_coordinate", &get_occevent_coordinate,
+  m.def("get_occevent_coordinate",
+        py::overload_cast<occ_events::OccEvent,
+                          std::vector<occ_events::OccEvent> const &,
+                          config::Supercell const &>(&get_occevent_coordinate),
         R"pbdoc(
       Determine the coordinates `(unitcell_index, equivalent_index)` of a OccEvent
 
@@ -393,6 +467,34 @@ PYBIND11_MODULE(_enumerate, m) {
         py::arg("occ_event"), py::arg("phenomenal_occevent"),
         py::arg("supercell"));
 
+  m.def("get_occevent_coordinates", &get_occevent_coordinates,
+        R"pbdoc(
+      Determine the coordinates `(unitcell_index, equivalent_index)` of many OccEvent
+
+      This is equivalent to calling :func:`get_occevent_coordinate` for each
+      OccEvent, but the phenomenal OccEvent list is converted and processed only
+      once.
+
+      Parameters
+      ----------
+
+      occ_events : List[libcasm.occ_events.OccEvent]
+          Input OccEvent, to find the coordinates of
+      phenomenal_occevent : List[libcasm.occ_events.OccEvent]
+          The phenomenal OccEvent for the equivalent local basis sets
+      supercell : libcasm.configuration.Supercell
+          The supercell in which the OccEvent are located
+
+      Returns
+      -------
+      coordinates : list[tuple[int, int]]
+          The coordinates (unitcell_index, equivalent_index) of each
+          input OccEvent, in order. Raises if no match can be found for any
+          OccEvent, indicating it is not in the same orbit.
+      )pbdoc",
+        py::arg("occ_events"), py::arg("phenomenal_occevent"),
+        py::arg("supercell"));
+
 #ifdef VERSION_INFO
   m.attr("__version__") = MACRO_STRINGIFY(VERSION_INFO);
 #else
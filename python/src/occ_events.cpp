@@ -93,6 +93,12 @@ occ_events::OccPosition make_default_occ_position() {
 /// \return Returns the coordinate (unitcell_index, equivalent_index) of
 ///     the input OccEvent. Throws if no match can be found, indicating the
 ///     input OccEvent is not in the same orbit.
+///
+/// Notes:
+/// - The matching logic is duplicated by `get_occevent_coordinate` in
+///   python/src/enumerate.cpp, which also provides a batched
+///   `get_occevent_coordinates` that constructs the phenomenal clusters only
+///   once. Keep the two in sync.
 std::tuple<Index, Index> get_occevent_coordinate(
     occ_events::OccEvent occ_event,
     std::vector<occ_events::OccEvent> const &phenomenal_occevent,
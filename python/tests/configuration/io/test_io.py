@@ -83,3 +83,44 @@ def test_configuration_list_io(simple_cubic_binary_prim):
     assert isinstance(configuration_list_3, list)
     assert len(configuration_list_3) == 2
     assert len(supercellset) == 2
+
+
+def test_configuration_list_io_write_prim_basis(FCC_binary_Hstrain_noshear_prim):
+    prim = config.Prim(FCC_binary_Hstrain_noshear_prim)
+
+    # conventional 4-site FCC
+    T = np.array(
+        [
+            [-1, 1, 1],
+            [1, -1, 1],
+            [1, 1, -1],
+        ]
+    )
+    supercell = config.Supercell(prim, T)
+
+    configuration1 = config.Configuration(supercell)
+    configuration1.set_occ(0, 1)
+    configuration1.set_global_dof_values("Hstrain", np.array([0.01, 0.02, 0.0]))
+
+    configuration2 = config.Configuration(supercell)
+    configuration2.set_global_dof_values("Hstrain", np.array([0.0, -0.01, 0.03]))
+
+    configuration_list = [
+        configuration1,
+        configuration2,
+    ]
+
+    # ~~~
+    data_list = config_io.configuration_list_to_data(
+        configuration_list, write_prim_basis=True
+    )
+    assert data_list == [x.to_dict(write_prim_basis=True) for x in configuration_list]
+
+    # the Hstrain prim basis is not the standard basis
+    assert data_list != config_io.configuration_list_to_data(configuration_list)
+
+    configuration_list_2 = config_io.configuration_list_from_data(data_list, prim=prim)
+    assert isinstance(configuration_list_2, list)
+    assert len(configuration_list_2) == 2
+    for x, y in zip(configuration_list, configuration_list_2):
+        assert x == y
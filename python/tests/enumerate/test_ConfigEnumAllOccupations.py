@@ -95,6 +95,31 @@ def test_ConfigEnumAllOccupations_by_supercell_list_FCC_1():
     assert len(configuration_set) == 29
 
 
+def test_ConfigEnumAllOccupations_by_supercell_list_duplicates():
+    xtal_prim = xtal_prims.FCC(
+        r=0.5,
+        occ_dof=["A", "B"],
+    )
+    prim = casmconfig.Prim(xtal_prim)
+    supercell_set = casmconfig.SupercellSet(prim=prim)
+    scel_enum = casmenum.ScelEnum(
+        prim=prim,
+        supercell_set=supercell_set,
+    )
+    supercell_list = [x for x in scel_enum.by_volume(max=4)]
+
+    config_enum = casmenum.ConfigEnumAllOccupations(
+        prim=prim,
+        supercell_set=supercell_set,
+    )
+    n_unique = len(list(config_enum.by_supercell_list(supercells=supercell_list)))
+    n_with_duplicates = len(
+        list(config_enum.by_supercell_list(supercells=supercell_list * 2))
+    )
+    assert n_unique == 29
+    assert n_with_duplicates == n_unique
+
+
 def test_ConfigEnumAllOccupations_by_supercell_list_FCC_2():
     xtal_prim = xtal_prims.FCC(
         r=0.5,
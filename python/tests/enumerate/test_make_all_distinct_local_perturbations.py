@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import libcasm.configuration as config
 import libcasm.enumerate as enum
@@ -58,6 +59,79 @@ def test_make_occevent_suborbits(fcc_1NN_A_Va_event):
     assert len(suborbits_2[1]) == 4
 
 
+def test_get_occevent_coordinates(fcc_1NN_A_Va_event):
+    # setup: FCC prim, 1NN A-Va exchange event
+    xtal_prim, occ_event = fcc_1NN_A_Va_event
+    prim = config.Prim(xtal_prim)
+
+    prim_rep = occ_events.make_occevent_symgroup_rep(
+        prim.factor_group.elements, prim.xtal_prim
+    )
+    phenomenal_occevent = occ_events.make_prim_periodic_orbit(occ_event, prim_rep)
+    assert len(phenomenal_occevent) == 6
+
+    # supercell: 2x2x2 of the conventional FCC
+    T = np.array(
+        [
+            [-1, 1, 1],
+            [1, -1, 1],
+            [1, 1, -1],
+        ]
+    )
+    supercell = config.Supercell(prim, T * 2)
+
+    translations = [
+        np.array([0, 0, 0]),
+        np.array([1, 0, 0]),
+        np.array([0, 1, -1]),
+        np.array([2, 1, 0]),
+    ]
+    events = []
+    for phenom in phenomenal_occevent:
+        for translation in translations:
+            events.append(phenom + translation)
+
+    coordinates = enum.get_occevent_coordinates(
+        occ_events=events,
+        phenomenal_occevent=phenomenal_occevent,
+        supercell=supercell,
+    )
+    expected = [
+        enum.get_occevent_coordinate(
+            occ_event=event,
+            phenomenal_occevent=phenomenal_occevent,
+            supercell=supercell,
+        )
+        for event in events
+    ]
+    assert len(coordinates) == len(events)
+    assert coordinates == expected
+    for i, (_, equivalent_index) in enumerate(coordinates):
+        assert equivalent_index == i // len(translations)
+
+    # an event from a different orbit (2NN A-Va exchange) raises
+    site1 = xtal.IntegralSiteCoordinate(sublattice=0, unitcell=[0, 0, 0])
+    site2 = xtal.IntegralSiteCoordinate(sublattice=0, unitcell=[1, 1, -1])
+    event_2NN = occ_events.OccEvent(
+        [
+            [
+                occ_events.OccPosition.molecule(site1, 0),
+                occ_events.OccPosition.molecule(site2, 0),
+            ],
+            [
+                occ_events.OccPosition.molecule(site2, 2),
+                occ_events.OccPosition.molecule(site1, 2),
+            ],
+        ]
+    )
+    with pytest.raises(RuntimeError):
+        enum.get_occevent_coordinates(
+            occ_events=events + [event_2NN],
+            phenomenal_occevent=phenomenal_occevent,
+            supercell=supercell,
+        )
+
+
 def test_make_all_distinct_local_perturbations(fcc_1NN_A_Va_event):
     # setup: FCC prim, 1NN A-Va exchange event
     xtal_prim, phenomenal_occ_event = fcc_1NN_A_Va_event
@@ -20,6 +20,18 @@ SupercellSymOp find_translation(Configuration const &configuration) {
   return std::find_if(begin, end, f);
 }
 
+/// \brief Return true if the volume of `supercell` is an integer multiple of
+///     the volume of `unit_supercell`
+///
+/// This is a necessary, but not sufficient, condition for `supercell` to be
+/// a superlattice of `unit_supercell`, or of any equivalent of it.
+bool is_volume_multiple(Supercell const &supercell,
+                        Supercell const &unit_supercell) {
+  Index volume = supercell.unitcell_index_converter.total_sites();
+  Index unit_volume = unit_supercell.unitcell_index_converter.total_sites();
+  return volume % unit_volume == 0;
+}
+
 }  // namespace
 
 /// \brief Copy configuration DoF values into a supercell
@@ -380,6 +392,13 @@ std::set<Index> unique_generating_prim_factor_group_indices(
       *prim_motif.supercell->sym_info.factor_group;
   double xtal_tol = prim.basicstructure->lattice().tol();
 
+  // Volume is invariant under prim factor group operations, so if the
+  // prim_motif volume does not divide the supercell volume no operation can
+  // make a tiling
+  if (!is_volume_multiple(*supercell, *prim_motif.supercell)) {
+    return std::set<Index>();
+  }
+
   // - Want to find the unique ways to fill supercell with prim_motif.
   // - Will be doing prim_fg_op * prim_motif, but only if
   //   supercell_lattice is a supercell of prim_fg_op*prim_motif_lattice.
@@ -435,8 +454,9 @@ std::vector<Configuration> make_all_super_configurations(
   std::vector<std::vector<Configuration>> by_subsets =
       make_all_super_configurations_by_subsets(motif, supercell);
   std::vector<Configuration> all;
-  for (auto const &subset : by_subsets) {
-    all.insert(std::end(all), std::begin(subset), std::end(subset));
+  for (auto &subset : by_subsets) {
+    all.insert(std::end(all), std::make_move_iterator(std::begin(subset)),
+               std::make_move_iterator(std::end(subset)));
   }
   return all;
 }
@@ -514,8 +534,9 @@ std::vector<ConfigurationWithProperties> make_all_super_configurations(
       make_all_super_configurations_by_subsets(motif_with_properties,
                                                supercell);
   std::vector<ConfigurationWithProperties> all;
-  for (auto const &subset : by_subsets) {
-    all.insert(std::end(all), std::begin(subset), std::end(subset));
+  for (auto &subset : by_subsets) {
+    all.insert(std::end(all), std::make_move_iterator(std::begin(subset)),
+               std::make_move_iterator(std::end(subset)));
   }
   return all;
 }
@@ -602,6 +623,9 @@ std::set<Configuration> make_all_super_configurations_check(
   double xtal_tol = prim.basicstructure->lattice().tol();
 
   std::set<Configuration> all;
+  if (!is_volume_multiple(*supercell, *prim_motif.supercell)) {
+    return all;
+  }
   UnitCell trans(0, 0, 0);
   UnitCell origin(0, 0, 0);
   SupercellSymOp begin = SupercellSymOp::begin(supercell);
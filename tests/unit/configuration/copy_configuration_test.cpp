@@ -3,6 +3,7 @@
 #include "casm/configuration/Configuration.hh"
 #include "casm/configuration/SupercellSymOp.hh"
 #include "casm/configuration/canonical_form.hh"
+#include "casm/crystallography/SymTools.hh"
 #include "casm/misc/CASM_Eigen_math.hh"
 #include "gtest/gtest.h"
 #include "teststructures.hh"
@@ -390,3 +391,177 @@ TEST_F(CopyConfigurationFCCTernaryGLStrainDispTest, Test1) {
     EXPECT_TRUE(is_canonical(tconfig, begin, end));
   }
 }
+
+// --- CopyConfigurationSuperTilingTest ---
+
+class CopyConfigurationSuperTilingTest : public testing::Test {
+ protected:
+  CopyConfigurationSuperTilingTest() {
+    prim = config::make_shared_prim(test::FCC_binary_prim());
+  }
+
+  std::shared_ptr<config::Supercell const> make_supercell(
+      Eigen::Matrix3l const &T) {
+    return std::make_shared<config::Supercell const>(prim, T);
+  }
+
+  /// Make a configuration with occupation layered along the prim lattice
+  /// vector a: occ=1 if (unitcell index along a) % period == 0, else occ=0
+  config::Configuration make_layered_motif(Eigen::Matrix3l const &T,
+                                           Index period) {
+    config::Configuration motif(make_supercell(T));
+    auto const &converter = motif.supercell->unitcellcoord_index_converter;
+    for (Index l = 0; l < converter.total_sites(); ++l) {
+      if (converter(l).unitcell()(0) % period == 0) {
+        motif.dof_values.occupation(l) = 1;
+      }
+    }
+    return motif;
+  }
+
+  /// Supercell transformation matrices that are tiled by some, but not
+  /// necessarily all, orientations of a volume 3 layered motif
+  std::vector<Eigen::Matrix3l> volume_3_supercell_T() {
+    std::vector<Eigen::Matrix3l> T_list(6);
+    T_list[0] << 3, 0, 0, 0, 1, 0, 0, 0, 1;
+    T_list[1] << 1, 0, 0, 0, 3, 0, 0, 0, 1;
+    T_list[2] << 3, 0, 0, 0, 2, 0, 0, 0, 1;
+    T_list[3] << 3, 0, 0, 0, 3, 0, 0, 0, 1;
+    T_list[4] << 1, 1, 0, 0, 3, 0, 0, 0, 1;
+    T_list[5] << 3, 0, 0, 0, 3, 0, 0, 0, 3;
+    return T_list;
+  }
+
+  /// Make all super configurations, checking for tilings using
+  /// `is_superlattice` with each transformed prim motif lattice
+  std::set<config::Configuration> make_all_super_configurations_reference(
+      config::Configuration const &motif,
+      std::shared_ptr<config::Supercell const> const &supercell) {
+    config::Configuration prim_motif = make_primitive(motif);
+    xtal::Lattice const &prim_motif_lattice =
+        prim_motif.supercell->superlattice.superlattice();
+    xtal::Lattice const &supercell_lattice =
+        supercell->superlattice.superlattice();
+    auto const &prim_fg = *prim->sym_info.factor_group;
+    double tol = prim->basicstructure->lattice().tol();
+
+    auto begin = config::SupercellSymOp::begin(supercell);
+    auto end = config::SupercellSymOp::end(supercell);
+    std::set<config::Configuration> all;
+    for (Index i = 0; i < prim_fg.element.size(); ++i) {
+      xtal::Lattice test_lattice =
+          sym::copy_apply(prim_fg.element[i], prim_motif_lattice);
+      if (!xtal::is_superlattice(supercell_lattice, test_lattice, tol).first) {
+        continue;
+      }
+      config::Configuration tmp =
+          copy_configuration(i, xtal::UnitCell(0, 0, 0), prim_motif, supercell);
+      for (auto it = begin; it != end; ++it) {
+        all.emplace(copy_apply(*it, tmp));
+      }
+    }
+    return all;
+  }
+
+  std::shared_ptr<config::Prim const> prim;
+};
+
+TEST_F(CopyConfigurationSuperTilingTest, MakeSuperConfigurationsTest1) {
+  // Non-primitive motif, with primitive volume 3 and trigonal symmetry
+  Eigen::Matrix3l T_motif;
+  T_motif << 3, 0, 0, 0, 2, 0, 0, 0, 1;
+  config::Configuration motif = make_layered_motif(T_motif, 3);
+
+  for (auto const &T : volume_3_supercell_T()) {
+    auto supercell = make_supercell(T);
+    auto begin = config::SupercellSymOp::begin(supercell);
+    auto end = config::SupercellSymOp::end(supercell);
+
+    std::set<config::Configuration> expected =
+        make_all_super_configurations_reference(motif, supercell);
+    EXPECT_TRUE(expected.size() > 0);
+
+    // make_all_super_configurations_check
+    std::set<config::Configuration> check =
+        make_all_super_configurations_check(motif, supercell);
+    EXPECT_TRUE(check == expected);
+
+    // make_all_super_configurations
+    std::vector<config::Configuration> all =
+        make_all_super_configurations(motif, supercell);
+    EXPECT_EQ(all.size(), expected.size());
+    EXPECT_TRUE(std::set<config::Configuration>(all.begin(), all.end()) ==
+                expected);
+
+    // make_distinct_super_configurations
+    std::vector<config::Configuration> distinct =
+        make_distinct_super_configurations(motif, supercell);
+    std::set<config::Configuration> canonical;
+    std::set<config::Configuration> from_distinct;
+    for (auto const &config : distinct) {
+      canonical.emplace(make_canonical_form(config, begin, end));
+      for (auto const &equiv : make_equivalents(config, begin, end)) {
+        from_distinct.emplace(equiv);
+      }
+    }
+    EXPECT_EQ(canonical.size(), distinct.size());
+    EXPECT_TRUE(from_distinct == expected);
+  }
+}
+
+TEST_F(CopyConfigurationSuperTilingTest, VolumeNotDivisibleTest1) {
+  // Motif with primitive volume 2
+  Eigen::Matrix3l T_motif;
+  T_motif << 2, 0, 0, 0, 1, 0, 0, 0, 1;
+  config::Configuration motif = make_layered_motif(T_motif, 2);
+  config::Configuration prim_motif = make_primitive(motif);
+  EXPECT_EQ(prim_motif.supercell->unitcell_index_converter.total_sites(), 2);
+
+  // Supercells with volume 3
+  std::vector<Eigen::Matrix3l> T_list(3);
+  T_list[0] << 3, 0, 0, 0, 1, 0, 0, 0, 1;
+  T_list[1] << 1, 0, 0, 0, 3, 0, 0, 0, 1;
+  T_list[2] << 1, 1, 0, 0, 3, 0, 0, 0, 1;
+
+  for (auto const &T : T_list) {
+    auto supercell = make_supercell(T);
+    EXPECT_EQ(unique_generating_prim_factor_group_indices(prim_motif, motif,
+                                                          supercell)
+                  .size(),
+              0);
+    EXPECT_EQ(make_distinct_super_configurations(motif, supercell).size(), 0);
+    EXPECT_EQ(make_all_super_configurations_check(motif, supercell).size(), 0);
+  }
+}
+
+TEST_F(CopyConfigurationSuperTilingTest, VolumeDivisibleNotTiledTest1) {
+  // Motif with primitive volume 2 (L1_1-like layering)
+  Eigen::Matrix3l T_motif;
+  T_motif << 2, 0, 0, 0, 1, 0, 0, 0, 1;
+  config::Configuration motif = make_layered_motif(T_motif, 2);
+
+  // Supercells with volume divisible by 2, but which are not superlattices
+  // of any orientation of the motif: a volume 2 L1_0-like supercell and the
+  // conventional 4-atom fcc supercell
+  std::vector<Eigen::Matrix3l> T_list(2);
+  T_list[0] << 1, 0, 0, 1, 2, 0, 0, 0, 1;
+  T_list[1] << -1, 1, 1, 1, -1, 1, 1, 1, -1;
+
+  for (auto const &T : T_list) {
+    auto supercell = make_supercell(T);
+    EXPECT_EQ(supercell->unitcell_index_converter.total_sites() % 2, 0);
+    EXPECT_EQ(make_all_super_configurations_reference(motif, supercell).size(),
+              0);
+    EXPECT_EQ(make_distinct_super_configurations(motif, supercell).size(), 0);
+    EXPECT_EQ(make_all_super_configurations_check(motif, supercell).size(), 0);
+  }
+
+  // The motif supercell is tiled
+  auto supercell = make_supercell(T_motif);
+  std::set<config::Configuration> expected =
+      make_all_super_configurations_reference(motif, supercell);
+  EXPECT_TRUE(expected.size() > 0);
+  EXPECT_TRUE(make_all_super_configurations_check(motif, supercell) ==
+              expected);
+  EXPECT_TRUE(make_distinct_super_configurations(motif, supercell).size() > 0);
+}